@@ -1,29 +1,78 @@
-import textwrap
-x = str(input("Enter the 100 Bit Data:"))
-k = 20
-a = 4
-A = []
-R = x[100:120]
-i_sum = "1111"
-arr = [x[i:i+k] for i in range(0, len(x), k)]
-for j in range(0, 5):
-    y = str(arr[j])
-    z = textwrap.wrap(y, a)
-    Sum = bin(int(z[0], 2)+int(z[1], 2)+int(z[2], 2)+int(z[3], 2)+int(z[4], 2))[2:]
-    if len(Sum) > a:
-        X = len(Sum) - a
-        Sum = bin(int(Sum[0:X], 2) + int(Sum[X:], 2))[2:]
-    if len(Sum) < a:
-        Sum = '0' * (a - len(Sum)) + Sum
-    S = R[j*a:(j+1)*a]
-    check = bin(int(Sum, 2) + int(S, 2))[2:]
-    if len(check) > a:
-        X = len(check) - a
-        Sum = bin(int(check[0:X], 2) + int(check[X:], 2))[2:]
-    iSum = bin(int(i_sum, 2) - int(check, 2))[2:]
-    if len(iSum) < a:
-        iSum = '0' * (a - len(iSum)) + iSum
-    if iSum == "0000":
-        print("No Error Detected in "+str(j+1)+" segment")
-    else:
-        print("Error Detected in "+str(j+1)+" segment and  "+str(j+1)+" segment is discarded")
\ No newline at end of file
+import argparse
+import random
+import sys
+import time
+
+# Import the shared kernel relative to the package when imported as
+# CheckSum.CheckSum_Reciver, and as a sibling module when run as a script
+try:
+    from .checksum_core import ONES_4BIT, SEGMENT_BITS, SUB_SEGMENT_BITS, segment_sums
+except ImportError:
+    from checksum_core import ONES_4BIT, SEGMENT_BITS, SUB_SEGMENT_BITS, segment_sums
+
+
+def verify(x):
+    """
+    Whether each segment of the 120 bit data matches its CheckSum.
+    """
+    # Parse the data once; the CheckSum is its low 20 bits
+    v = int(x, 2)
+    sums = segment_sums(v >> SEGMENT_BITS)
+    # A segment is intact when its sum plus its CheckSum is all ones
+    return [sums[j] + ((v >> (SEGMENT_BITS - SUB_SEGMENT_BITS * (j + 1)))
+                       & ONES_4BIT) == ONES_4BIT
+            for j in range(0, 5)]
+
+
+def receive(x, verbose=True):
+    """
+    Verify the 120 bit data, writing one report line per segment unless
+    verbose is False.
+    """
+    results = verify(x)
+    if verbose:
+        report = []
+        for j, ok in enumerate(results):
+            if ok:
+                report.append("No Error Detected in "+str(j+1)+" segment")
+            else:
+                report.append("Error Detected in "+str(j+1)+" segment and  "+str(j+1)+" segment is discarded")
+        sys.stdout.write('\n'.join(report) + '\n')
+    return results
+
+
+def bench(n, seed=None):
+    """
+    Verify n random 120 bit inputs and report the throughput.
+    """
+    rng = random.Random(seed)
+    inputs = [format(rng.getrandbits(120), '0120b') for _ in range(n)]
+    start = time.perf_counter()
+    for x in inputs:
+        receive(x, verbose=False)
+    elapsed = time.perf_counter() - start
+    # A run too short for the timer to register reports an infinite rate
+    rate = n / elapsed if elapsed else float('inf')
+    print("Verified {} inputs in {:.3f}s ({:.0f} inputs/s)".format(n, elapsed, rate))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CheckSum receiver for 100 bit data plus its CheckSum.")
+    parser.add_argument("--input", help="120 bit received data; prompted for when omitted")
+    parser.add_argument("--bench", type=int, metavar="N", help="verify N random inputs and report throughput")
+    parser.add_argument("--seed", type=int, help="random seed for --bench")
+    args = parser.parse_args()
+    if args.bench is not None and args.bench < 1:
+        parser.error("--bench N must be at least 1")
+    if args.bench is not None:
+        bench(args.bench, args.seed)
+        return
+    x = args.input if args.input is not None else str(input("Enter the 100 Bit Data:"))
+    # str.strip leaves any character other than 0/1 behind, in one C-level scan
+    if len(x) != 120 or x.strip('01'):
+        sys.exit("Invalid Data: expected 120 bits of 0s and 1s")
+    receive(x)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,27 +1,76 @@
-import textwrap
-x = str(input("Enter the 100 Bit Data:"))
-k = 20
-a = 4
-A = []
-isum = "1111"
-arr = [x[i:i+k] for i in range(0, len(x), k)]
-for j in range(0, 5):
-    y = str(arr[j])
-    z = textwrap.wrap(y, a)
-    print(z)
-    Sum = bin(int(z[0], 2)+int(z[1], 2)+int(z[2], 2)+int(z[3], 2)+int(z[4], 2))[2:]
-    if len(Sum) > a:
-        X = len(Sum) - a
-        Sum = bin(int(Sum[0:X], 2) + int(Sum[X:], 2))[2:]
-    if len(Sum) < a:
-        Sum = '0' * (a - len(Sum)) + Sum
-    iSum = bin(int(isum, 2) - int(Sum, 2))[2:]
-    if len(iSum) < a:
-        iSum = '0' * (a - len(iSum)) + iSum
-    print(Sum)
-    print(iSum)
-    A.append(iSum)
-Check = (''.join(A))
-print("Data:"+x)
-print("CheckSum:"+Check)
-print("Transmitted Data:"+x+Check)
\ No newline at end of file
+import argparse
+import random
+import sys
+import time
+
+# Import the shared kernel relative to the package when imported as
+# CheckSum.CheckSum_Sender, and as a sibling module when run as a script
+try:
+    from .checksum_core import SEGMENT_BITS, SUB_SEGMENT_BITS, segment_sums
+except ImportError:
+    from checksum_core import SEGMENT_BITS, SUB_SEGMENT_BITS, segment_sums
+
+# One's complement of a binary string, flipping every bit in one C-level pass
+_FLIP = str.maketrans('01', '10')
+
+
+def _chunks(s, n):
+    return [s[i:i+n] for i in range(0, len(s), n)]
+
+
+def checksum(x):
+    """
+    CheckSum of the 100 bit data: the complement of every segment sum.
+    """
+    # Parse the data once and format the five sums in a single call
+    total = 0
+    for s in segment_sums(int(x, 2)):
+        total = (total << SUB_SEGMENT_BITS) | s
+    return format(total, '0{}b'.format(SEGMENT_BITS)).translate(_FLIP)
+
+
+def bench(n, seed=None):
+    """
+    Checksum n random 100 bit inputs and report the throughput.
+    """
+    rng = random.Random(seed)
+    inputs = [format(rng.getrandbits(100), '0100b') for _ in range(n)]
+    start = time.perf_counter()
+    for x in inputs:
+        checksum(x)
+    elapsed = time.perf_counter() - start
+    # A run too short for the timer to register reports an infinite rate
+    rate = n / elapsed if elapsed else float('inf')
+    print("Checksummed {} inputs in {:.3f}s ({:.0f} inputs/s)".format(n, elapsed, rate))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CheckSum sender for 100 bit data.")
+    parser.add_argument("--input", help="100 bit data; prompted for when omitted")
+    parser.add_argument("--bench", type=int, metavar="N", help="checksum N random inputs and report throughput")
+    parser.add_argument("--seed", type=int, help="random seed for --bench")
+    args = parser.parse_args()
+    if args.bench is not None and args.bench < 1:
+        parser.error("--bench N must be at least 1")
+    if args.bench is not None:
+        bench(args.bench, args.seed)
+        return
+    x = args.input if args.input is not None else str(input("Enter the 100 Bit Data:"))
+    # str.strip leaves any character other than 0/1 behind, in one C-level scan
+    if len(x) != 100 or x.strip('01'):
+        sys.exit("Invalid Data: expected 100 bits of 0s and 1s")
+    # Compute the CheckSum through the same path --bench times, and slice
+    # each segment's complemented sum back out of it for display
+    Check = checksum(x)
+    arr = _chunks(x, SEGMENT_BITS)
+    for j, iSum in enumerate(_chunks(Check, SUB_SEGMENT_BITS)):
+        print(_chunks(arr[j], SUB_SEGMENT_BITS))
+        print(iSum.translate(_FLIP))
+        print(iSum)
+    print("Data:"+x)
+    print("CheckSum:"+Check)
+    print("Transmitted Data:"+x+Check)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+# checksum: sender and receiver
+
+from .CheckSum_Reciver import receive, verify
+from .CheckSum_Sender import checksum
+
+__all__ = ['checksum', 'verify', 'receive']
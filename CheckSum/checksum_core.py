@@ -0,0 +1,22 @@
+# checksum_core.py
+
+ONES_4BIT = 0xF
+# Bits per segment, and per sub-segment summed within it
+SEGMENT_BITS = 20
+SUB_SEGMENT_BITS = 4
+
+
+def segment_sums(v):
+    """
+    One's complement sum of the sub-segments of each 20-bit segment of the
+    100 bit data, given as an int.
+    """
+    # Segment j occupies bits 80 - 20 * j up; take its sub-segments out with
+    # shifts, then fold the carries back in twice (a single fold can itself
+    # carry out of the low bits)
+    sums = [sum((v >> i) & ONES_4BIT
+                for i in range(base, base + SEGMENT_BITS, SUB_SEGMENT_BITS))
+            for base in range(100 - SEGMENT_BITS, -1, -SEGMENT_BITS)]
+    sums = [(s & ONES_4BIT) + (s >> SUB_SEGMENT_BITS) for s in sums]
+    sums = [(s & ONES_4BIT) + (s >> SUB_SEGMENT_BITS) for s in sums]
+    return sums
@@ -0,0 +1,112 @@
+# crc: sender and receiver
+
+import binascii
+import functools
+import zlib
+
+__all__ = ['calculate_crc', 'verify_crc', 'send_with_crc']
+
+# Bit-reversed value of every byte, for feeding zlib's reflected CRC-32
+_REVERSED_BYTES = bytes(int(format(b, '08b')[::-1], 2) for b in range(256))
+
+def _crc32(payload):
+    """
+    Plain (non-reflected, zero-init) CRC-32 remainder computed by zlib.
+    """
+    # zlib reflects the bits and uses an all-ones start and final XOR
+    crc = zlib.crc32(payload.translate(_REVERSED_BYTES), 0xFFFFFFFF) ^ 0xFFFFFFFF
+    # Reverse the 32 result bits: swap the byte order, reverse each byte
+    return int.from_bytes(crc.to_bytes(4, 'little').translate(_REVERSED_BYTES), 'big')
+
+def _crc16(payload):
+    """
+    Plain (zero-init) CRC-16-CCITT remainder computed by binascii.
+    """
+    return binascii.crc_hqx(payload, 0)
+
+# Standard generators with a C implementation in the standard library
+_HW_POLYS = {
+    '100000100110000010001110110110111': _crc32,
+    '10001000000100001': _crc16,
+}
+
+def _build_crc_table(gen_int, width):
+    """
+    Build the 256-entry table for byte-wise CRC division.
+    """
+    top = 1 << (width - 1)
+    mask = (1 << width) - 1
+    table = []
+    for byte in range(256):
+        r = byte << (width - 8)
+        for _ in range(8):
+            r = (r << 1) ^ gen_int if r & top else r << 1
+        table.append(r & mask)
+    return table
+
+def _crc_kernel(payload, table, width):
+    """
+    Divide the bytes of payload through a CRC table, returning the remainder.
+    """
+    mask = (1 << width) - 1
+    shift = width - 8
+    crc = 0
+    for byte in payload:
+        crc = ((crc << 8) & mask) ^ table[(crc >> shift) ^ byte]
+    return crc
+
+def _crc8_kernel(payload, table, width):
+    """
+    _crc_kernel specialised for an 8-bit register: one lookup per byte.
+    """
+    crc = 0
+    for byte in payload:
+        crc = table[crc ^ byte]
+    return crc
+
+@functools.lru_cache(maxsize=32)
+def _gen_constants(generator):
+    """
+    CRC width, register padding, register width, table and division kernel
+    for a generator.
+    """
+    # Generators narrower than a byte run in an 8-bit register, shifted up
+    width = len(generator) - 1
+    pad = max(0, 8 - width)
+    reg = width + pad
+    kernel = _crc8_kernel if reg == 8 else _crc_kernel
+    return width, pad, reg, _build_crc_table(int(generator, 2) << pad, reg), kernel
+
+def calculate_crc(data, generator):
+    """
+    Calculate CRC checksum for the given data and generator polynomial.
+    """
+    width, pad, reg, table, kernel = _gen_constants(generator)
+    # Pack the data into bytes; the division starts from a zero remainder,
+    # so the zero bits padding the first byte do not change the CRC
+    payload = int(data or '0', 2).to_bytes((len(data) + 7) // 8, 'big')
+    if generator in _HW_POLYS:
+        return format(_HW_POLYS[generator](payload), '0{}b'.format(width))
+    # Perform CRC division one byte at a time
+    crc = kernel(payload, table, reg)
+    # Return CRC bits
+    return format(crc >> pad, '0{}b'.format(width))
+
+def send_with_crc(data, generator):
+    """
+    Send data with CRC checksum.
+    """
+    # Calculate CRC checksum
+    crc_checksum = calculate_crc(data, generator)
+    # Return data with CRC checksum
+    return data + crc_checksum
+
+def verify_crc(received_data, generator):
+    """
+    Verify CRC checksum for the received data.
+    """
+    width = len(generator) - 1
+    # Data is intact only if its CRC matches the appended one; an empty
+    # frame carries a zero CRC, as calculate_crc gives empty data
+    crc = calculate_crc(received_data[:-width], generator)
+    return int(crc, 2) == int(received_data[-width:] or '0', 2)
@@ -0,0 +1,6 @@
+# hamming: sender and receiver
+
+from .HammingReciver import decode_hamming
+from .HammingSender import encode_hamming
+
+__all__ = ['encode_hamming', 'decode_hamming']
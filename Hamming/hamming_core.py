@@ -0,0 +1,100 @@
+# hamming_core.py
+
+import functools
+
+# Translation table deleting 0 and 1; anything left over is not binary
+_BIN_DEL = str.maketrans('', '', '01')
+
+def is_binary_string(s):
+    """
+    Check that s is a non-empty string of 0s and 1s.
+    """
+    return bool(s) and not s.translate(_BIN_DEL)
+
+@functools.lru_cache(maxsize=32)
+def _parity_masks(n, r):
+    """
+    Masks of the positions covered by each parity bit, position j + 1 of
+    the code being bit n - 1 - j. They only depend on the code length, so
+    a stream of same-length codes builds them once.
+    """
+    masks = []
+    for i in range(r):
+        p = 1 << i
+        period = 2 * p
+        # Bit t of the word is position n - t, covered when (n - t) & p; over
+        # any period of 2p bits that is one run of p bits, starting at bit
+        # (n + 1) % 2p and wrapping around
+        start = (n + 1) % period
+        run = (1 << p) - 1
+        mask = ((run << start) | (run >> (period - start))) & ((1 << period) - 1)
+        # Tile the period across the word by doubling
+        width = period
+        while width < n:
+            mask |= mask << width
+            width *= 2
+        masks.append(mask & ((1 << n) - 1))
+    return tuple(masks)
+
+def _syndrome(word, n, r):
+    """
+    XOR of the positions of all 1 bits in the n-bit word, taken a parity
+    bit at a time: bit i is the parity of the positions parity bit i covers.
+    """
+    syndrome = 0
+    for i, mask in enumerate(_parity_masks(n, r)):
+        if (word & mask).bit_count() & 1:
+            syndrome |= 1 << i
+    return syndrome
+
+def encode_bits(data):
+    """
+    Encode data bits, given as ASCII 0/1 bytes, using Hamming Code.
+    """
+    # Calculate the number of redundant bits needed (r); 2 ** r must exceed
+    # the data length, so start from its bit length and step up at most once
+    r = len(data).bit_length()
+    while (1 << r) < len(data) + r + 1:
+        r += 1
+    # Initialize the Hamming code
+    n = len(data) + r
+    hamming_code = bytearray(b'0' * n)
+    # Fill in the data bits; they sit between consecutive parity bits, at
+    # positions 2 ** i + 1 to 2 ** (i + 1) - 1, so copy a whole gap at a time
+    k = 0
+    for i in range(r):
+        start, end = 1 << i, min((2 << i) - 1, n)
+        hamming_code[start:end] = data[k:k + end - start]
+        k += end - start
+    # Fill in the redundant bits: with them still 0, the syndrome of the
+    # code is exactly the parity bits that make it check clean
+    parity = _syndrome(int(hamming_code, 2), n, r)
+    for i in range(r):
+        if parity >> i & 1:
+            hamming_code[(1 << i) - 1] = 0x31
+    return bytes(hamming_code)
+
+def decode_bits(code):
+    """
+    Correct a received Hamming code, given as ASCII 0/1 bytes.
+
+    Returns the corrected code and the error position, 0 if there was no
+    error. A position past the end of the code cannot be corrected, and the
+    code is returned unchanged.
+    """
+    # Calculate the number of redundant bits needed (r), the smallest r
+    # with 2 ** r >= n
+    n = len(code)
+    r = (n - 1).bit_length()
+    # Check for errors, with the Hamming code held as an integer (position
+    # j + 1 being bit n - 1 - j); the syndrome is the position of an error
+    error_bit = _syndrome(int(code, 2), n, r)
+    # Correct the error if detected by flipping that ASCII digit; flipping
+    # the bit at the syndrome's position clears every failing parity, so no
+    # re-check is needed
+    if 0 < error_bit <= n:
+        corrected = bytearray(code)
+        corrected[error_bit - 1] ^= 1
+        return bytes(corrected), error_bit
+    # Otherwise hand back the received code itself rather than a copy
+    return code, error_bit
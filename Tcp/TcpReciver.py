@@ -3,6 +3,10 @@ import socket
 def receive_file(host, port, filename):
     # Create a TCP/IP socket
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Let the kernel buffer more data per receive; accepted
+        # connections inherit this
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        
         # Bind the socket to the address
         s.bind((host, port))
         # Listen for incoming connections
@@ -17,15 +21,21 @@ def receive_file(host, port, filename):
         print('Connected by', addr)
         
         with conn:
-            # Open the file in binary write mode
-            with open(filename, 'wb') as f:
+            # Receive into one reusable buffer instead of a new bytes
+            # object per chunk
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            # Open the file in binary write mode, with a 4 MiB write buffer
+            # so the partial chunks recv_into returns are gathered into
+            # fewer, larger write syscalls
+            with open(filename, 'wb', buffering=1 << 22) as f:
                 while True:
                     # Receive data from the client
-                    data = conn.recv(1024)
-                    if not data:
+                    n = conn.recv_into(view)
+                    if not n:
                         break
                     # Write data to the file
-                    f.write(data)
+                    f.write(view[:n])
             print('File received successfully')
 
 # Define the DDNS hostname and port to listen on
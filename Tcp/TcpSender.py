@@ -1,22 +1,53 @@
+import os
 import socket
+import time
+
+# How long a resolved address is reused; a DDNS record can change at any time
+RESOLVE_TTL = 60.0
+
+# Resolved addresses, as host -> (ip, expiry on the monotonic clock)
+_resolved = {}
+
+def _resolve(host):
+    # Reuse a recent lookup, so repeated sends skip DNS until it expires
+    entry = _resolved.get(host)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    ip = socket.gethostbyname(host)
+    _resolved[host] = (ip, time.monotonic() + RESOLVE_TTL)
+    return ip
 
 def send_file(host, port, filename):
     # Create a TCP/IP socket
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Let the kernel queue more data per send
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        
         # Resolve the DDNS hostname to get the IP address
-        remote_ip = socket.gethostbyname(host)
+        remote_ip = _resolve(host)
         
-        # Connect the socket to the server
-        s.connect((remote_ip, port))
+        # Connect the socket to the server, forgetting the address if it no
+        # longer answers so the next send resolves the host again
+        try:
+            s.connect((remote_ip, port))
+        except OSError:
+            _resolved.pop(host, None)
+            raise
         
         # Open the file in binary read mode
         with open(filename, 'rb') as f:
-            # Read data from the file and send it
-            while True:
-                data = f.read(1024)
-                if not data:
-                    break
-                s.sendall(data)
+            if hasattr(os, 'sendfile'):
+                # Send the file with sendfile(2), so the data never passes
+                # through Python
+                s.sendfile(f)
+            else:
+                # Read data from the file and send it, 1 MiB per syscall
+                # rather than socket.sendfile's 8 KiB fallback
+                while True:
+                    data = f.read(1 << 20)
+                    if not data:
+                        break
+                    s.sendall(data)
         print('File sent successfully')
 
 # Define the DDNS hostname of the server
@@ -26,5 +57,7 @@ PORT = 12345
 # Define the filename of the file to send
 FILENAME = 'file_to_send.txt'
 
-# Call the function to send the file
-send_file(HOST, PORT, FILENAME)
+if __name__ == '__main__':
+    # Call the function to send the file; importing the module instead lets
+    # send_file be called repeatedly, reusing the cached address
+    send_file(HOST, PORT, FILENAME)
@@ -1,4 +1,6 @@
+import selectors
 import socket
+import sys
 
 # Specify the port number to listen on
 RECEIVER_PORT = 6000
@@ -6,13 +8,41 @@ RECEIVER_PORT = 6000
 # Create a UDP socket
 receiver_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
+# Give the kernel room to queue bursts of datagrams between reads
+receiver_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 << 20)
+
 # Bind the socket to the server address and port
 receiver_socket.bind(('0.0.0.0', RECEIVER_PORT))
 
 print('Receiver is listening...')
 
+# Read without blocking, so a burst of datagrams can be drained at once,
+# and wait for readiness through the platform's best selector (epoll on
+# Linux, kqueue on BSD/macOS)
+receiver_socket.setblocking(False)
+selector = selectors.DefaultSelector()
+selector.register(receiver_socket, selectors.EVENT_READ)
+
+# Receive every datagram into one reusable buffer
+buffer = bytearray(1024)
+
 # Receive data from senders indefinitely
 while True:
-    # Receive data and the address of the sender
-    data, sender_address = receiver_socket.recvfrom(1024)
-    print(f"Received message from {sender_address}: {data.decode('utf-8')}")
+    # Wait until at least one datagram has arrived, and drain each socket
+    # the selector reports as readable
+    for key, _ in selector.select():
+        sock = key.fileobj
+        # Drain what is already queued (up to 1024 datagrams) and write the
+        # whole burst with one write and flush instead of a print per datagram
+        lines = []
+        try:
+            while len(lines) < 1024:
+                # Receive data and the address of the sender
+                size, sender_address = sock.recvfrom_into(buffer)
+                lines.append(f"Received message from {sender_address}: {buffer[:size].decode('utf-8')}\n")
+        except BlockingIOError:
+            pass
+        finally:
+            # Write what was drained even if a later datagram fails to decode
+            sys.stdout.write(''.join(lines))
+            sys.stdout.flush()